@@ -0,0 +1,68 @@
+"""
+Cache Module
+============
+
+Simple TTL-based on-disk cache for remote API results. Repeated queries
+within the TTL window are served from disk and skip the network entirely.
+
+"""
+
+import hashlib
+import os
+import pickle
+import time
+from functools import wraps
+
+CACHE_DIR = '.cache'
+
+class FileCache:
+    """Persistent on-disk cache storing pickled values stamped with a timestamp."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, namespace, key):
+        digest = hashlib.md5(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, namespace, f"{digest}.pkl")
+
+    def get(self, namespace, key, ttl):
+        """Return the cached value, or None if missing or older than ttl seconds."""
+        path = self._path(namespace, key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+        if time.time() - entry['timestamp'] > ttl:
+            return None
+        return entry['value']
+
+    def set(self, namespace, key, value):
+        """Store a value under namespace/key, stamped with the current time."""
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump({'timestamp': time.time(), 'value': value}, f)
+
+_file_cache = FileCache()
+
+def cached(ttl):
+    """Decorator caching a function's return value on disk for ttl seconds.
+
+    The cache key is built from the function name and its arguments, so
+    each symbol/endpoint combination gets its own entry. Failed calls
+    (None results) are not cached.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = repr((args, sorted(kwargs.items())))
+            value = _file_cache.get(func.__name__, key, ttl)
+            if value is not None:
+                return value
+            value = func(*args, **kwargs)
+            if value is not None:
+                _file_cache.set(func.__name__, key, value)
+            return value
+        return wrapper
+    return decorator
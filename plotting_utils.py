@@ -7,10 +7,43 @@ Separated from the Streamlit app for better code organization and reusability.
 
 """
 
+import matplotlib
+matplotlib.use('Agg')  # headless backend; Streamlit renders figures itself
 import matplotlib.pyplot as plt
+import numpy as np
 import seaborn as sns
 import pandas as pd
 
+def _oi_by_type(df, types):
+    """Sum open interest per option type with plain NumPy masks.
+
+    Chains are at most a few thousand rows, where a mask-and-sum beats
+    the dispatch and index construction of a pandas groupby. Types with
+    no open interest are dropped, matching the old observed-only output.
+    """
+    type_values = df['Type'].to_numpy()
+    oi_values = df['Open_Interest'].to_numpy()
+    summary = pd.Series({t: oi_values[type_values == t].sum() for t in types})
+    return summary[summary > 0]
+
+def _plot_volume_bars(ax, plot_df, type_colors):
+    """Draw grouped volume-by-strike bars from a pre-summed pivot table.
+
+    Pivoting once and calling ax.bar per option type avoids seaborn's
+    internal groupby and confidence-interval machinery, which is wasted
+    work on already-aggregated values.
+    """
+    pv = plot_df.pivot_table(index='Strike', columns='Type', values='Volume',
+                             aggfunc='sum', fill_value=0, observed=True).sort_index()
+    pv = pv.reindex(columns=list(type_colors), fill_value=0)
+    x = np.arange(len(pv))
+    width = 0.4
+    for offset, (option_type, color) in zip([-width / 2, width / 2], type_colors.items()):
+        ax.bar(x + offset, pv[option_type], width, color=color, label=option_type)
+    ax.set_xticks(x)
+    ax.set_xticklabels(pv.index, rotation=45, ha='right')
+    ax.legend(title='Type')
+
 def generate_us_plots(df, symbol):
     """Generate Matplotlib figures for US market options dashboard."""
     if df is None or df.empty:
@@ -18,8 +51,11 @@ def generate_us_plots(df, symbol):
 
     sns.set_style("whitegrid")
 
+    # Compute each aggregation once and reuse it across the figures
+    oi_summary = _oi_by_type(df, ('Call', 'Put'))
+    vol_by_strike = df.groupby('Strike', observed=True)['Volume'].sum()
+
     # 1. Open Interest (Calls vs Puts)
-    oi_summary = df.groupby('Type')['Open_Interest'].sum()
     fig1, ax1 = plt.subplots(figsize=(6, 5))
     if not oi_summary.empty and oi_summary.sum() > 0:
         color_map = {'Call': 'g', 'Put': 'r'}
@@ -31,18 +67,17 @@ def generate_us_plots(df, symbol):
         ax1.text(0.5, 0.5, 'No Open Interest Data', horizontalalignment='center', verticalalignment='center')
     
     # 2. Volume by Strike Price (Top 20 most active strikes)
-    top_strikes_df = df.groupby('Strike')['Volume'].sum().nlargest(20).reset_index()
-    plot_df = df[df['Strike'].isin(top_strikes_df['Strike'])]
+    top_strikes = vol_by_strike.nlargest(20)
+    # Hash-join against the top-20 index keeps only matching rows in one
+    # pass, instead of an isin() scan plus boolean indexing
+    plot_df = df.merge(top_strikes.rename('Strike_Volume'), left_on='Strike', right_index=True)
     
     fig2, ax2 = plt.subplots(figsize=(15, 7))
     if not plot_df.empty and plot_df['Volume'].sum() > 0:
-        sns.barplot(data=plot_df, x='Strike', y='Volume', hue='Type', 
-                   palette={'Call': 'g', 'Put': 'r'}, 
-                   order=sorted(plot_df['Strike'].unique()), ax=ax2)
+        _plot_volume_bars(ax2, plot_df, {'Call': 'g', 'Put': 'r'})
         ax2.set_title(f'Volume by Strike Price for {symbol} (Top 20 Active Strikes)')
         ax2.set_xlabel('Strike Price')
         ax2.set_ylabel('Volume')
-        plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
     else:
         ax2.text(0.5, 0.5, 'No Volume Data', horizontalalignment='center', verticalalignment='center')
     
@@ -56,8 +91,11 @@ def generate_nifty_plots(df):
 
     sns.set_style("whitegrid")
 
+    # Compute each aggregation once and reuse it across the figures
+    oi_summary = _oi_by_type(df, ('CE', 'PE'))
+    vol_by_strike = df.groupby('Strike', observed=True)['Volume'].sum()
+
     # 1. Open Interest Distribution
-    oi_summary = df.groupby('Type')['Open_Interest'].sum()
     fig1, ax1 = plt.subplots(figsize=(6, 5))
     if not oi_summary.empty and oi_summary.sum() > 0:
         color_map = {'CE': 'g', 'PE': 'r'}
@@ -69,27 +107,25 @@ def generate_nifty_plots(df):
         ax1.text(0.5, 0.5, 'No Open Interest Data', horizontalalignment='center', verticalalignment='center')
     
     # 2. Volume by Strike Price
-    top_strikes_df = df.groupby('Strike')['Volume'].sum().nlargest(20).reset_index()
-    plot_df = df[df['Strike'].isin(top_strikes_df['Strike'])]
+    top_strikes = vol_by_strike.nlargest(20)
+    # Hash-join against the top-20 index keeps only matching rows in one
+    # pass, instead of an isin() scan plus boolean indexing
+    plot_df = df.merge(top_strikes.rename('Strike_Volume'), left_on='Strike', right_index=True)
     
     fig2, ax2 = plt.subplots(figsize=(15, 7))
     if not plot_df.empty and plot_df['Volume'].sum() > 0:
-        sns.barplot(data=plot_df, x='Strike', y='Volume', hue='Type', 
-                   palette={'CE': 'g', 'PE': 'r'}, 
-                   order=sorted(plot_df['Strike'].unique()), ax=ax2)
+        _plot_volume_bars(ax2, plot_df, {'CE': 'g', 'PE': 'r'})
         ax2.set_title('NIFTY Volume by Strike Price (Top 20 Active Strikes)')
         ax2.set_xlabel('Strike Price')
         ax2.set_ylabel('Volume')
-        plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
     else:
         ax2.text(0.5, 0.5, 'No Volume Data', horizontalalignment='center', verticalalignment='center')
     
-    # 3. Put-Call Ratio
+    # 3. Put-Call Ratio (reuses the open-interest aggregation from fig1)
     fig3, ax3 = plt.subplots(figsize=(10, 6))
     if not df.empty:
-        pc_ratio = df.groupby('Type')['Open_Interest'].sum()
-        if 'PE' in pc_ratio and 'CE' in pc_ratio and pc_ratio['CE'] > 0:
-            ratio = pc_ratio['PE'] / pc_ratio['CE']
+        if 'PE' in oi_summary and 'CE' in oi_summary and oi_summary['CE'] > 0:
+            ratio = oi_summary['PE'] / oi_summary['CE']
             ax3.bar(['Put-Call Ratio'], [ratio], color='orange')
             ax3.set_title(f'NIFTY Put-Call Ratio: {ratio:.2f}')
             ax3.set_ylabel('Ratio')
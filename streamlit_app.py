@@ -9,7 +9,9 @@ Users can view options chain data, including key metrics and visualizations for
 """
 
 import streamlit as st
+import matplotlib.pyplot as plt
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Import functions from separate modules
@@ -22,8 +24,31 @@ from data_fetchers import (
 )
 from plotting_utils import generate_us_plots, generate_nifty_plots
 
+# In-process cache layer on top of the on-disk cache, so Streamlit reruns
+# within the TTL window skip the fetch entirely
+fetch_options_chain = st.cache_data(ttl=60)(fetch_options_chain)
+fetch_nifty_options = st.cache_data(ttl=60)(fetch_nifty_options)
+
+# Memoize figure generation keyed on the DataFrame contents, so reruns
+# with an unchanged chain reuse the cached figures instead of re-plotting
+_df_hash_funcs = {pd.DataFrame: lambda d: pd.util.hash_pandas_object(d, index=True).values.tobytes()}
+generate_us_plots = st.cache_data(hash_funcs=_df_hash_funcs)(generate_us_plots)
+generate_nifty_plots = st.cache_data(hash_funcs=_df_hash_funcs)(generate_nifty_plots)
+
+# The plotters only touch these columns; passing a slim projection keeps
+# the extra chain columns out of their groupby/merge/sort passes
+PLOT_COLUMNS = ['Type', 'Strike', 'Open_Interest', 'Volume']
+
 st.set_page_config(layout="wide")
 
+@st.cache_data
+def filter_nifty_chain(df, option_type_filter, strike_range):
+    """Filter the NIFTY chain by option type and strike range in one pass."""
+    mask = df['Strike'].between(strike_range[0], strike_range[1])
+    if option_type_filter != "All":
+        mask &= df['Type'] == option_type_filter
+    return df.loc[mask]
+
 # --- Streamlit App ---
 
 st.title("📈 Global Options Dashboard")
@@ -46,19 +71,24 @@ with tab1:
     if st.sidebar.button("Fetch US Options Data", key="us_fetch"):
         
         with st.spinner(f"Fetching data for {selected_symbol}..."):
-            
-            # Get and display stock info
-            stock_info = get_stock_info(selected_symbol)
+
+            # Stock info and the options chain are independent network
+            # calls, so fetch them concurrently to hide the latency
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                info_future = executor.submit(get_stock_info, selected_symbol)
+                options_future = executor.submit(fetch_options_chain, selected_symbol)
+                stock_info = info_future.result()
+                options_data = options_future.result()
+
+            # Display stock info
             if stock_info:
                 st.subheader(f"{stock_info['name']} ({stock_info['symbol']})")
                 col1, col2, col3 = st.columns(3)
                 col1.metric("Current Price", f"${stock_info['current_price']:.2f}")
                 col2.metric("Market Cap", f"${stock_info['market_cap'] / 1e12:.2f}T")
                 col3.metric("Sector", stock_info['sector'])
-            
-            # Fetch and process options data
-            options_data = fetch_options_chain(selected_symbol)
-            
+
+            # Process options data
             if options_data:
                 df = process_options_data(options_data)
                 
@@ -66,16 +96,18 @@ with tab1:
                     st.subheader("Options Analysis")
                     
                     # Generate and display plots
-                    fig_oi, fig_volume = generate_us_plots(df, selected_symbol)
+                    fig_oi, fig_volume = generate_us_plots(df[PLOT_COLUMNS], selected_symbol)
                     
                     col1, col2 = st.columns(2)
                     with col1:
                         if fig_oi:
                             st.pyplot(fig_oi)
+                            plt.close(fig_oi)
                     with col2:
                         if fig_volume:
                             st.pyplot(fig_volume)
-                            
+                            plt.close(fig_volume)
+
                     st.subheader("Options Chain Data")
                     st.dataframe(df)
                     
@@ -104,15 +136,16 @@ with tab2:
                     # Display summary metrics
                     st.subheader("NIFTY Options Summary")
                     
+                    # One pass over Type gets both counts
+                    type_counts = df_nifty['Type'].value_counts()
+
                     col1, col2, col3, col4 = st.columns(4)
                     with col1:
                         st.metric("Total Contracts", len(df_nifty))
                     with col2:
-                        ce_count = len(df_nifty[df_nifty['Type'] == 'CE'])
-                        st.metric("Call Options (CE)", ce_count)
+                        st.metric("Call Options (CE)", int(type_counts.get('CE', 0)))
                     with col3:
-                        pe_count = len(df_nifty[df_nifty['Type'] == 'PE'])
-                        st.metric("Put Options (PE)", pe_count)
+                        st.metric("Put Options (PE)", int(type_counts.get('PE', 0)))
                     with col4:
                         if 'Underlying' in df_nifty.columns and not df_nifty['Underlying'].isna().all():
                             underlying_value = df_nifty['Underlying'].iloc[0]
@@ -122,19 +155,22 @@ with tab2:
                     
                     # Generate and display plots
                     st.subheader("NIFTY Options Analysis")
-                    fig_oi, fig_volume, fig_pc_ratio = generate_nifty_plots(df_nifty)
+                    fig_oi, fig_volume, fig_pc_ratio = generate_nifty_plots(df_nifty[PLOT_COLUMNS])
                     
                     # Display plots in columns
                     col1, col2 = st.columns(2)
                     with col1:
                         if fig_oi:
                             st.pyplot(fig_oi)
+                            plt.close(fig_oi)
                     with col2:
                         if fig_pc_ratio:
                             st.pyplot(fig_pc_ratio)
-                    
+                            plt.close(fig_pc_ratio)
+
                     if fig_volume:
                         st.pyplot(fig_volume)
+                        plt.close(fig_volume)
                     
                     # Display the data
                     st.subheader("NIFTY Options Chain Data")
@@ -152,14 +188,7 @@ with tab2:
                             strike_range = (0, 100)
                     
                     # Apply filters
-                    filtered_df = df_nifty.copy()
-                    if option_type_filter != "All":
-                        filtered_df = filtered_df[filtered_df['Type'] == option_type_filter]
-                    if not df_nifty.empty:
-                        filtered_df = filtered_df[
-                            (filtered_df['Strike'] >= strike_range[0]) & 
-                            (filtered_df['Strike'] <= strike_range[1])
-                        ]
+                    filtered_df = filter_nifty_chain(df_nifty, option_type_filter, strike_range)
                     
                     st.dataframe(filtered_df)
                     